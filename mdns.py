@@ -5,14 +5,20 @@ A standalone markdown file explorer and editor that integrates with optional mod
 """
 
 import os
+import re
 import sys
+import itertools
 import subprocess
+import threading
+import time
+from array import array
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime
-from typing import List, Optional, Tuple, Dict, Any
+from typing import List, Optional, Tuple, Dict, Set, Iterator, Any, Union
 import argparse
 
-from textual import on
+from textual import on, work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, ScrollableContainer
@@ -22,6 +28,7 @@ from textual.widgets import (
     ListView, ListItem, Button
 )
 from textual.message import Message
+from textual.worker import get_current_worker
 
 # Try to import optional dependencies
 try:
@@ -31,15 +38,36 @@ except ImportError:
     HAS_CLIPBOARD = False
 
 try:
-    from rapidfuzz import fuzz
+    from rapidfuzz import fuzz, process
     HAS_FUZZY = True
 except ImportError:
     HAS_FUZZY = False
 
 # Constants
-KNOWN_MODULES = ["stampt", "blipt", "smallt", "templet", "gitnot", "ql"]
-TEXT_EXTENSIONS = {'.md', '.txt', '.text', '.markdown', '.rst', '.org', '.todo'}
+MODULE_CONFIGS = [  # (module, menu key, description)
+    ("stampt", "s", "Timestamped notes with dashboard"),
+    ("blipt", "b", "Quick scratchpad with numbered entries"),
+    ("smallt", "t", "Simple task manager"),
+    ("templet", "o", "Lightweight template manager"),
+    ("gitnot", "g", "Lightweight version control"),
+    ("ql", "l", "Quick command launcher"),
+]
+KNOWN_MODULES = [module for module, _, _ in MODULE_CONFIGS]
+TEXT_EXTENSIONS = frozenset({'.md', '.txt', '.text', '.markdown', '.rst', '.org', '.todo'})
+SEARCH_SCORE_CUTOFF = 60  # Minimum fuzzy score for a search match
+SEARCH_RESULT_LIMIT = 200  # Max number of search matches listed
 PREVIEW_CACHE_SIZE = 100  # Max number of previews to cache
+MDNS_DIR = Path(sys.argv[0]).resolve().parent  # Where modules are installed
+PREVIEW_PLACEHOLDER = "…"  # Shown until the real preview is loaded
+APPEND_BATCH_SIZE = 32  # Rows added to the file list per UI update
+LIST_PAGE_SIZE = 200  # Rows mounted before waiting for the user to reach the end
+LIST_PAGE_MARGIN = 20  # Rows from the end at which the next page is loaded
+PREVIEW_READ_SIZE = 256  # Bytes read from a file to build its preview
+TEXT_SNIFF_SIZE = 512  # Bytes checked for null bytes in extension-less files
+READ_CHUNK_SIZE = 64 * 1024  # Bytes per read when loading a whole file
+PREVIEW_SCREEN_LIMIT = 100000  # Max bytes shown on the preview screen
+SEARCH_DEBOUNCE = 0.1  # Seconds of typing pause before the list is filtered
+NOTIFY_REPEAT_WINDOW = 0.2  # Seconds within which a repeated notification is dropped
 
 
 # ============================================================================
@@ -49,22 +77,27 @@ PREVIEW_CACHE_SIZE = 100  # Max number of previews to cache
 class ModuleManager:
     """Manages integration with standalone modules"""
     
+    # Modules found so far; misses aren't kept, so a module installed
+    # while mdns runs is still picked up
+    _module_paths: Dict[str, Path] = {}
+    
     @staticmethod
     def get_module_path(module_name: str) -> Optional[Path]:
-        """Find module in same directory as mdns"""
-        mdns_dir = Path(sys.argv[0]).resolve().parent
+        """Find module in same directory as mdns (cached until clear_cache)"""
+        module_path = ModuleManager._module_paths.get(module_name)
+        if module_path is not None:
+            return module_path
         
         # Check for executable without extension first
-        module_path = mdns_dir / module_name
-        if module_path.exists() and module_path.is_file():
-            return module_path
-            
-        # Fallback to .py extension
-        module_path = mdns_dir / f"{module_name}.py"
-        if module_path.exists():
-            return module_path
+        module_path = MDNS_DIR / module_name
+        if not (module_path.exists() and module_path.is_file()):
+            # Fallback to .py extension
+            module_path = MDNS_DIR / f"{module_name}.py"
+            if not module_path.exists():
+                return None
             
-        return None
+        ModuleManager._module_paths[module_name] = module_path
+        return module_path
     
     @staticmethod
     def check_module(module_name: str) -> Tuple[bool, str]:
@@ -74,15 +107,27 @@ class ModuleManager:
         if module_path:
             return True, f"Found: {module_path.name}"
         else:
-            mdns_dir = Path(sys.argv[0]).resolve().parent
             return False, (
                 f"Module '{module_name}' not found!\n\n"
                 f"To install, place {module_name} in:\n"
-                f"{mdns_dir}/\n\n"
+                f"{MDNS_DIR}/\n\n"
                 f"Make sure it's executable:\n"
-                f"chmod +x {mdns_dir}/{module_name}"
+                f"chmod +x {MDNS_DIR}/{module_name}"
             )
     
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget cached module lookups so moved or removed modules are noticed"""
+        ModuleManager._module_paths.clear()
+    
+    @staticmethod
+    def installed_modules() -> Set[str]:
+        """Find all known modules, the same way launching one does"""
+        return {
+            module for module in KNOWN_MODULES
+            if ModuleManager.get_module_path(module)
+        }
+    
     @staticmethod
     def run_module(module_name: str) -> None:
         """Run a standalone module"""
@@ -110,17 +155,95 @@ class ModuleManager:
 # File Management
 # ============================================================================
 
+def read_file_head(path: Union[str, os.PathLike], size: int) -> bytes:
+    """Read up to size bytes from the start of a file"""
+    # A raw fd skips the buffered/text wrapper setup of open()
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
+def read_file(path: Union[str, os.PathLike], limit: Optional[int] = None) -> bytes:
+    """Read a whole file, or at most limit bytes of it"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = []
+        remaining = limit
+        while remaining is None or remaining > 0:
+            size = READ_CHUNK_SIZE if remaining is None else min(READ_CHUNK_SIZE, remaining)
+            chunk = os.read(fd, size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            if remaining is not None:
+                remaining -= len(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def score_matches(query: str, choices: List[str], limit: int) -> List[Tuple[int, float]]:
+    """Score case-folded choices against a case-folded query
+    
+    Returns up to limit (index, score) pairs, best first. Substring hits
+    score 100 without running the fuzzy scorer; the rest are scored with
+    rapidfuzz when it is installed and dropped otherwise.
+    """
+    # Keep the fuzzy candidates as a plain list of str for rapidfuzz
+    hits = []
+    candidates = []
+    candidate_strings = []
+    for i, choice in enumerate(choices):
+        # A substring hit is a perfect partial_ratio score
+        if query in choice:
+            hits.append(i)
+        else:
+            candidates.append(i)
+            candidate_strings.append(choice)
+    
+    results = [(i, 100) for i in hits[:limit]]
+    remaining = limit - len(results)
+    
+    if HAS_FUZZY and candidate_strings and remaining:
+        # Scores the rest in one call and keeps the top matches
+        matches = process.extract(
+            query, candidate_strings,
+            scorer=fuzz.partial_ratio,
+            score_cutoff=SEARCH_SCORE_CUTOFF,
+            limit=remaining,
+        )
+        results.extend((candidates[index], score) for _, score, index in matches)
+        
+    return results
+
+
 class FileItem(ListItem):
     """Custom ListItem that stores file path and metadata"""
-    def __init__(self, path: Path, preview: str, is_dir: bool = False):
+    def __init__(self, path_str: str, name: str, preview: str, is_dir: bool = False):
         icon = "📁" if is_dir else "📄"
-        # Format with better alignment
-        name = path.name[:40] + "..." if len(path.name) > 40 else path.name
-        label_text = f"{icon} {name:<45} {preview}"
-        super().__init__(Label(label_text))
-        self.path = path
+        # Format with better alignment, keeping long names at 40 characters
+        display_name = name[:37] + "..." if len(name) > 40 else name
+        label_prefix = icon + " " + display_name.ljust(45) + " "
+        super().__init__(Label(label_prefix + preview))
+        self._path_str = path_str
+        self.file_name = name
         self.preview = preview
         self.is_dir = is_dir
+        # Only directories and files are listed, so this is known from the scan
+        self.is_file = not is_dir
+        self._label_prefix = label_prefix
+        
+    @property
+    def path(self) -> Path:
+        """Path of the entry, built on demand"""
+        return Path(self._path_str)
+        
+    def set_preview(self, preview: str) -> None:
+        """Replace the preview shown next to the name"""
+        self.preview = preview
+        self.query_one(Label).update(self._label_prefix + preview)
 
 
 class FileExplorer(ListView):
@@ -131,120 +254,458 @@ class FileExplorer(ListView):
         Binding("k", "cursor_up", "Up", show=False),
     ]
     
+    # Collapses newlines and runs of whitespace in previews
+    _WS_RE = re.compile(r'\s+')
+    
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # Directory being listed; the process cwd is never changed
+        self.path = Path.cwd()
         self.show_hidden = False
         self.current_filter = ""
-        self._preview_cache: Dict[Tuple[Path, float], str] = {}
+        # LRU of previews, shared by refresh workers running in threads
+        self._preview_cache: "OrderedDict[Tuple[str, float], str]" = OrderedDict()
+        self._preview_lock = threading.Lock()
+        # Case-folded "name preview" strings for the current directory,
+        # keyed by path and stored alongside the preview they came from
+        self._searchable_cache: Dict[str, Tuple[str, str]] = {}
+        # Columns of every file read by the last search scan, tagged with
+        # that scan's generation and the last query scored against them,
+        # and the oldest scan whose columns a search may still reuse
+        self._last_search: Optional[Tuple[int, str, list, list, list, list]] = None
+        self._search_reset_gen = 0
+        # Bumped by every refresh so a superseded scan can stop early, and
+        # only one scan reads the disk at a time
+        self._scan_gen = 0
+        self._scan_slot = threading.BoundedSemaphore(1)
+        # Rows listed before the current refresh, kept so unchanged ones
+        # can be reused, and how far through them the refresh has got
+        self._merge_old: List[ListItem] = []
+        self._merge_index: Dict[Tuple[str, bool], int] = {}
+        self._merge_next = 0
+        # Rows of the current listing that haven't been mounted yet
+        self._more_rows: Optional[Tuple[Iterator, bool, int]] = None
+        # Last directory listing, hidden entries included, as parallel
+        # columns (see _read_directory)
+        self._entries: List[os.DirEntry] = []
+        self._names_folded: List[str] = []
+        self._is_dir = array('b')
+        self._is_hidden = array('b')
+        self._needs_sniff = array('b')
+        # Scan that read the listing above, and the oldest scan allowed to
+        # reuse it instead of reading the directory again
+        self._listing_gen = 0
+        self._rescan_gen = 0
         
-    def get_preview(self, file_path: Path, max_length: int = 40) -> str:
-        """Get a preview of file content with caching"""
-        if file_path.is_dir():
+    def get_preview(self, entry: os.DirEntry, max_length: int = 40,
+                    prefetched: Optional[bytes] = None) -> str:
+        """Get a preview of file content with caching
+        
+        prefetched is the start of the file if it was already read, which
+        saves opening it a second time.
+        """
+        if entry.is_dir():
             try:
-                count = len(list(file_path.iterdir()))
+                with os.scandir(entry.path) as it:
+                    count = sum(1 for _ in it)
                 return f"<{count} items>"
             except:
                 return "<folder>"
         
         # Check cache first
         try:
-            mtime = file_path.stat().st_mtime
+            mtime = entry.stat().st_mtime
         except:
             mtime = 0
             
-        cache_key = (file_path, mtime)
-        if cache_key in self._preview_cache:
-            return self._preview_cache[cache_key]
-        
-        # Limit cache size
-        if len(self._preview_cache) > PREVIEW_CACHE_SIZE:
-            # Remove oldest entries
-            self._preview_cache = dict(
-                list(self._preview_cache.items())[-PREVIEW_CACHE_SIZE//2:]
-            )
+        cache_key = (entry.path, mtime)
+        with self._preview_lock:
+            if cache_key in self._preview_cache:
+                self._preview_cache.move_to_end(cache_key)
+                return self._preview_cache[cache_key]
             
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read(200).strip()
-                if not content:
-                    preview = "<empty>"
-                else:
-                    # Clean up for preview
-                    content = content.replace('\n', ' ')
-                    content = ' '.join(content.split())
-                    preview = content[:max_length] + "..." if len(content) > max_length else content
+            if prefetched is None:
+                prefetched = read_file_head(entry.path, PREVIEW_READ_SIZE)
+            content = prefetched[:PREVIEW_READ_SIZE].decode('utf-8', errors='ignore')
+            # Clean up for preview
+            content = self._WS_RE.sub(' ', content).strip()
+            if not content:
+                preview = "<empty>"
+            else:
+                preview = content[:max_length] + "..." if len(content) > max_length else content
                     
-            self._preview_cache[cache_key] = preview
+            with self._preview_lock:
+                self._preview_cache[cache_key] = preview
+                # Evict least recently used entries
+                while len(self._preview_cache) > PREVIEW_CACHE_SIZE:
+                    self._preview_cache.popitem(last=False)
             return preview
         except:
             return "<unable to read>"
             
-    def refresh_files(self, search_term: str = ""):
-        """Refresh the file list"""
-        self.clear()
-        self.current_filter = search_term
+    def _read_directory(self) -> None:
+        """Read the directories and text files in self.path into the column arrays
         
-        try:
-            current_dir = Path.cwd()
-            items = []
+        Entries are kept as parallel columns sorted by name: the DirEntry,
+        its case-folded name, whether it is a directory, whether it is
+        hidden, and whether it still needs the null-byte check for
+        extension-less files. Hidden entries are always read, so toggling
+        them only has to filter the columns.
+        """
+        # Filter while reading the directory so skipped entries are never
+        # sorted. DirEntry caches type and stat info from the directory
+        # read, so the checks below don't each cost a syscall
+        candidates = []  # (name_folded, name, entry, is_dir, needs_sniff)
+        with os.scandir(self.path) as it:
+            for entry in it:
+                # Include directories and text files
+                name = entry.name
+                if entry.is_dir():
+                    candidates.append((name.casefold(), name, entry, True, False))
+                elif entry.is_file():
+                    suffix = os.path.splitext(name)[1]
+                    # Most suffixes are already lowercase, so try them as-is first
+                    if suffix in TEXT_EXTENSIONS or suffix.lower() in TEXT_EXTENSIONS:
+                        candidates.append((name.casefold(), name, entry, False, False))
+                    elif suffix == '':
+                        # Files without extension might be text, which is
+                        # checked as rows stream so the reads are spread out
+                        candidates.append((name.casefold(), name, entry, False, True))
+        
+        # Case-insensitive by name, using the case-folded name computed above.
+        # Names are unique, so the DirEntry itself is never compared
+        candidates.sort()
+        
+        self._names_folded = [c[0] for c in candidates]
+        self._entries = [c[2] for c in candidates]
+        self._is_dir = array('b', [c[3] for c in candidates])
+        self._is_hidden = array('b', [c[1].startswith('.') for c in candidates])
+        self._needs_sniff = array('b', [c[4] for c in candidates])
+        
+    def _scan_entries(self, gen: int):
+        """Yield (index, entry, is_dir, head) for the directories and text files in self.path
+        
+        index is the entry's row in the column arrays, and head holds the
+        bytes already read from the file, if any. The directory is only read
+        again if a rescan was asked for since the last read.
+        """
+        if self._listing_gen < self._rescan_gen:
+            self._read_directory()
+            self._listing_gen = gen
+        # Bind the columns so a later scan can't swap them mid-listing
+        entries, is_dirs, needs_sniff = self._entries, self._is_dir, self._needs_sniff
+        is_hidden = self._is_hidden
+        show_hidden = self.show_hidden
+        
+        for i, entry in enumerate(entries):
+            # Skip hidden files unless enabled
+            if is_hidden[i] and not show_hidden:
+                continue
+            if not needs_sniff[i]:
+                yield i, entry, bool(is_dirs[i]), None
+                continue
+            try:
+                # Quick check if it's text
+                chunk = read_file_head(entry.path, TEXT_SNIFF_SIZE)
+                if b'\0' not in chunk:  # No null bytes = likely text
+                    yield i, entry, False, chunk
+            except:
+                pass
             
-            # Get all items
-            for item in sorted(current_dir.iterdir()):
-                # Skip hidden files unless enabled
-                if not self.show_hidden and item.name.startswith('.'):
-                    continue
+    def refresh_files(self, search_term: str = "", incremental: bool = False,
+                      rescan: bool = True):
+        """Refresh the file list
+        
+        With incremental set, a query that extends the previous one re-scores
+        the files read by the last search scan instead of reading the
+        directory and previews again.
+        With rescan unset, the last directory listing is filtered again
+        instead of reading the directory.
+        """
+        self.current_filter = search_term
+        self._scan_gen += 1
+        if not incremental:
+            # Anything the last search read may be out of date now
+            self._last_search = None
+            self._search_reset_gen = self._scan_gen
+        if rescan:
+            self._rescan_gen = self._scan_gen
+        self._more_rows = None
+        self._load_files(search_term, incremental, self._scan_gen)
+        
+    def refilter(self):
+        """List the last directory listing again, e.g. after show_hidden changed"""
+        self.refresh_files(self.current_filter, rescan=False)
+        
+    def _is_stale(self, gen: int) -> bool:
+        """Whether a newer refresh has started since scan gen"""
+        return gen != self._scan_gen
+        
+    @work(thread=True, exclusive=True, group="refresh-files")
+    def _load_files(self, search_term: str, incremental: bool, gen: int) -> None:
+        """Run a scan once the previous one has finished"""
+        with self._scan_slot:
+            if not self._is_stale(gen):
+                self._scan_and_show(search_term, incremental, gen)
                 
-                # Include directories and text files
-                if item.is_dir():
-                    items.append((item, self.get_preview(item), True))
-                elif item.is_file() and (item.suffix.lower() in TEXT_EXTENSIONS or item.suffix == ''):
-                    # Check files without extension if they might be text
-                    if item.suffix == '':
-                        try:
-                            # Quick check if it's text
-                            with open(item, 'rb') as f:
-                                chunk = f.read(512)
-                                if b'\0' not in chunk:  # No null bytes = likely text
-                                    items.append((item, self.get_preview(item), False))
-                        except:
-                            pass
-                    else:
-                        items.append((item, self.get_preview(item), False))
-                    
-            # Apply search filter
+    def _scan_and_show(self, search_term: str, incremental: bool, gen: int) -> None:
+        """Scan the directory and stream rows into the list in batches"""
+        try:
             if search_term:
-                filtered_items = []
-                search_lower = search_term.lower()
+                search_folded = search_term.casefold()
+                last_search = self._last_search if incremental else None
                 
-                for path, preview, is_dir in items:
-                    searchable = f"{path.name} {preview}".lower()
-                    
-                    if HAS_FUZZY:
-                        score = fuzz.partial_ratio(search_lower, searchable)
-                        if score > 60:
-                            filtered_items.append((path, preview, is_dir, score))
-                    else:
-                        if search_lower in searchable:
-                            filtered_items.append((path, preview, is_dir, 100))
+                if (last_search and last_search[0] >= self._search_reset_gen
+                        and search_folded.startswith(last_search[1])):
+                    # A longer query can fuzzy-match files a shorter one
+                    # missed, so every file is scored again, but nothing is
+                    # read from disk
+                    gen_read, _, entries, previews, is_dirs, searchables = last_search
+                    self._last_search = (
+                        gen_read, search_folded, entries, previews, is_dirs, searchables
+                    )
+                else:
+                    # Search looks at previews too, so they are needed up
+                    # front. Columns are kept as parallel lists, indexed by
+                    # the scorer
+                    entries = []
+                    names_folded = []
+                    previews = []
+                    is_dirs = []
+                    for i, entry, is_dir, head in self._scan_entries(gen):
+                        if self._is_stale(gen):
+                            return
+                        entries.append(entry)
+                        names_folded.append(self._names_folded[i])
+                        previews.append(self.get_preview(entry, prefetched=head))
+                        is_dirs.append(is_dir)
+                    searchables = self._get_searchables(entries, names_folded, previews)
+                    self._last_search = (
+                        gen, search_folded, entries, previews, is_dirs, searchables
+                    )
                 
-                # Sort by score
-                filtered_items.sort(key=lambda x: x[3], reverse=True)
-                items = [(p, pv, d) for p, pv, d, _ in filtered_items]
-                        
-            # Add items to list
-            if not items:
+                # Only the best matches are listed, so refine the query
+                # to see more
+                matches = score_matches(search_folded, searchables, SEARCH_RESULT_LIMIT)
+                rows = (
+                    (entries[i], None,
+                     (entries[i].path, entries[i].name, previews[i], is_dirs[i]))
+                    for i, _ in matches
+                )
+                deferred_previews = False
+            else:
+                self._last_search = None
+                
+                # Show names right away and fill in previews afterwards
+                rows = (
+                    (entry, head, (entry.path, entry.name, PREVIEW_PLACEHOLDER, is_dir))
+                    for _, entry, is_dir, head in self._scan_entries(gen)
+                )
+                deferred_previews = True
+            
+            if self._is_stale(gen):
+                return
+            if not self._stream_rows(rows, deferred_previews, gen, replace=True):
+                if self._is_stale(gen):
+                    return
                 if search_term:
-                    self.append(ListItem(Label("No files found matching your search")))
+                    self.app.call_from_thread(
+                        self._show_message, "No files found matching your search", gen
+                    )
                 else:
-                    self.append(ListItem(Label("No text files in this directory")))
-            else:
-                for path, preview, is_dir in items:
-                    self.append(FileItem(path, preview, is_dir))
-                    
+                    self.app.call_from_thread(
+                        self._show_message, "No text files in this directory", gen
+                    )
+                
         except PermissionError:
-            self.append(ListItem(Label("⚠️  Permission denied")))
+            if not self._is_stale(gen):
+                self.app.call_from_thread(self._show_message, "⚠️  Permission denied", gen)
         except Exception as e:
-            self.append(ListItem(Label(f"⚠️  Error: {str(e)}")))
+            if not self._is_stale(gen):
+                self.app.call_from_thread(self._show_message, f"⚠️  Error: {str(e)}", gen)
+                
+    def _stream_rows(self, rows: Iterator, deferred_previews: bool, gen: int,
+                     replace: bool = False) -> bool:
+        """Show the next page of (entry, head, row) tuples in batches
+        
+        Rows past LIST_PAGE_SIZE are left for _load_more_rows. With
+        deferred_previews set, the real previews are loaded once the page is
+        shown. Returns whether any rows were shown.
+        """
+        rows = iter(rows)
+        pending = []
+        shown = False
+        
+        # Add items to list. Only plain row data is built here; the
+        # widgets are created on the UI thread by _show_rows
+        batch = []
+        sources = []
+        for entry, head, row in itertools.islice(rows, LIST_PAGE_SIZE):
+            batch.append(row)
+            sources.append((entry, head))
+            if len(batch) >= APPEND_BATCH_SIZE:
+                if self._is_stale(gen):
+                    return shown
+                items = self.app.call_from_thread(
+                    self._show_rows, batch, replace, False, gen
+                )
+                pending.extend(zip(items, sources))
+                shown = True
+                replace = False
+                batch = []
+                sources = []
+        
+        if self._is_stale(gen):
+            return shown
+        if batch or shown:
+            items = self.app.call_from_thread(
+                self._show_rows, batch, replace, True, gen
+            )
+            pending.extend(zip(items, sources))
+            shown = True
+            
+        # Keep the rest of the listing for when the user gets near the end
+        next_row = next(rows, None)
+        if next_row is not None and not self._is_stale(gen):
+            self._more_rows = (itertools.chain([next_row], rows), deferred_previews, gen)
+        
+        # Load the previews that were deferred above
+        batch = []
+        for item, (entry, head) in pending if deferred_previews else ():
+            batch.append((item, self.get_preview(entry, prefetched=head)))
+            if len(batch) >= APPEND_BATCH_SIZE:
+                if self._is_stale(gen):
+                    return shown
+                self.app.call_from_thread(self._apply_previews, batch)
+                batch = []
+        if batch and not self._is_stale(gen):
+            self.app.call_from_thread(self._apply_previews, batch)
+            
+        return shown
+        
+    def _load_more_rows(self) -> None:
+        """Show the next page of the current listing, if there is one"""
+        if self._more_rows is not None:
+            more_rows, self._more_rows = self._more_rows, None
+            self._load_page(*more_rows)
+            
+    @work(thread=True, group="file-list-page")
+    def _load_page(self, rows: Iterator, deferred_previews: bool, gen: int) -> None:
+        """Stream another page of rows once any running scan is done"""
+        with self._scan_slot:
+            if self._is_stale(gen):
+                return
+            try:
+                self._stream_rows(rows, deferred_previews, gen)
+            except Exception as e:
+                if not self._is_stale(gen):
+                    self.app.call_from_thread(
+                        self.notify, f"Error listing files: {e}", severity="error"
+                    )
+                    
+    def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
+        """Load more rows as the cursor nears the end of the list"""
+        if self.index is not None and self.index >= len(self) - LIST_PAGE_MARGIN:
+            self._load_more_rows()
+            
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        """Load more rows as the list is scrolled near the bottom"""
+        super().watch_scroll_y(old_value, new_value)
+        if new_value >= self.max_scroll_y - LIST_PAGE_MARGIN:
+            self._load_more_rows()
+            
+    def _get_searchables(self, entries: List[os.DirEntry], names_folded: List[str],
+                         previews: List[str]) -> List[str]:
+        """Get the case-folded search text for each entry, reusing earlier ones"""
+        previous = self._searchable_cache
+        cache = {}
+        searchables = []
+        for entry, name_folded, preview in zip(entries, names_folded, previews):
+            cached = previous.get(entry.path)
+            # A changed preview means the file changed
+            if cached is None or cached[0] != preview:
+                cached = (preview, f"{name_folded} {preview.casefold()}")
+            cache[entry.path] = cached
+            searchables.append(cached[1])
+        
+        # Only keep the entries that are still listed
+        self._searchable_cache = cache
+        return searchables
+        
+    async def _show_rows(self, rows: List[Tuple[str, str, str, bool]],
+                         replace: bool, final: bool, gen: int) -> List[FileItem]:
+        """Merge FileItems for (path, name, preview, is_dir) rows into the list
+        
+        replace starts a new refresh and final ends it. Rows that were
+        already listed keep their widget, so only rows that changed are
+        mounted or removed. Rows from a superseded scan are dropped.
+        """
+        if self._is_stale(gen):
+            return []
+        
+        if replace:
+            self._merge_old = list(self.children)
+            self._merge_index = {
+                (child._path_str, child.is_dir): i
+                for i, child in enumerate(self._merge_old)
+                if isinstance(child, FileItem)
+            }
+            self._merge_next = 0
+            self.index = None
+            
+        old = self._merge_old
+        next_old = self._merge_next
+        items = []
+        new_items = []
+        to_remove = []
+        
+        for row in rows:
+            path_str, _, preview, is_dir = row
+            old_index = self._merge_index.get((path_str, is_dir), -1)
+            if old_index < next_old:
+                items.append(FileItem(*row))
+                new_items.append(items[-1])
+                continue
+            
+            # Rows skipped over are no longer listed
+            item = old[old_index]
+            to_remove.extend(old[next_old:old_index])
+            next_old = old_index + 1
+            if new_items:
+                await self.mount(*new_items, before=item)
+                new_items = []
+            if preview != PREVIEW_PLACEHOLDER and preview != item.preview:
+                item.set_preview(preview)
+            items.append(item)
+            
+        if new_items:
+            if next_old < len(old):
+                await self.mount(*new_items, before=old[next_old])
+            else:
+                await self.mount(*new_items)
+        if final:
+            to_remove.extend(old[next_old:])
+            self._merge_old = []
+            self._merge_index = {}
+        if to_remove:
+            await self.remove_children(to_remove)
+            
+        self._merge_next = next_old
+        return items
+        
+    async def _show_message(self, message: str, gen: int) -> None:
+        """Replace the list with a single message row"""
+        if self._is_stale(gen):
+            return
+        await self.clear()
+        await self.append(ListItem(Label(message)))
+        
+    def _apply_previews(self, previews: List[Tuple[FileItem, str]]) -> None:
+        """Swap placeholder previews for the loaded ones"""
+        for item, preview in previews:
+            if item.is_mounted and item.preview != preview:
+                item.set_preview(preview)
 
 
 # ============================================================================
@@ -412,18 +873,39 @@ class EditorScreen(Screen):
         editor = self.query_one("#editor", TextArea)
         
         if self.file_path and self.file_path.exists():
-            try:
-                content = self.file_path.read_text(encoding='utf-8')
-                self.original_content = content
-                editor.text = content
-                self.sub_title = str(self.file_path.name)
-            except Exception as e:
-                editor.text = f"Error loading file: {e}"
-                editor.read_only = True
+            # Read in the background so the screen paints right away
+            editor.loading = True
+            self._load_file()
         else:
             self.sub_title = "new file"
             
         editor.focus()
+        
+    @work(thread=True, exclusive=True)
+    def _load_file(self) -> None:
+        """Read the file off the UI thread"""
+        worker = get_current_worker()
+        try:
+            content = read_file(self.file_path).decode('utf-8')
+        except Exception as e:
+            if not worker.is_cancelled:
+                self.app.call_from_thread(self._apply_content, None, e)
+        else:
+            if not worker.is_cancelled:
+                self.app.call_from_thread(self._apply_content, content)
+                
+    def _apply_content(self, content: Optional[str], error: Optional[Exception] = None):
+        """Show the loaded file, or why it couldn't be loaded"""
+        editor = self.query_one("#editor", TextArea)
+        editor.loading = False
+        
+        if error is not None:
+            editor.text = f"Error loading file: {error}"
+            editor.read_only = True
+        else:
+            self.original_content = content
+            editor.text = content
+            self.sub_title = str(self.file_path.name)
     
     def on_text_area_changed(self, event: TextArea.Changed):
         """Track modifications"""
@@ -443,6 +925,10 @@ class EditorScreen(Screen):
         """Save the file"""
         editor = self.query_one("#editor", TextArea)
         
+        if editor.loading:
+            self.notify("Cannot save: file is still loading", severity="warning")
+            return
+            
         if editor.read_only:
             self.notify("Cannot save: file is read-only", severity="error")
             return
@@ -527,10 +1013,13 @@ class PreviewScreen(Screen):
         content_widget = self.query_one("#preview-content", Static)
         
         try:
-            content = self.file_path.read_text(encoding='utf-8')
-            # Limit preview length for performance
-            if len(content) > 100000:
-                content = content[:100000] + "\n\n... (truncated)"
+            # Limit preview length for performance, without reading the rest
+            raw = read_file(self.file_path, PREVIEW_SCREEN_LIMIT + 1)
+            if len(raw) > PREVIEW_SCREEN_LIMIT:
+                content = raw[:PREVIEW_SCREEN_LIMIT].decode('utf-8', errors='replace')
+                content += "\n\n... (truncated)"
+            else:
+                content = raw.decode('utf-8', errors='replace')
             content_widget.update(content)
         except Exception as e:
             content_widget.update(f"Error loading file: {e}")
@@ -551,14 +1040,29 @@ class ModulesScreen(Screen):
     BINDINGS = [
         Binding("escape", "close", "Close"),
         Binding("q", "close", "Close"),
-        Binding("s", "launch_stampt", "Launch stampt"),
-        Binding("b", "launch_blipt", "Launch blipt"),
-        Binding("t", "launch_smallt", "Launch smallt"),
-        Binding("o", "launch_templet", "Launch templet"),
-        Binding("g", "launch_gitnot", "Launch gitnot"),
-        Binding("l", "launch_ql", "Launch ql"),
+        *(
+            Binding(key, f"launch_module('{module}')", f"Launch {module}")
+            for module, key, _ in MODULE_CONFIGS
+        ),
     ]
     
+    # Menu text with a {status<n>} slot per module for its ✓/✗ mark
+    _MENU_TEMPLATE = (
+        "# Available Modules\n"
+        "Press the key shown to launch a module.\n\n"
+        + "".join(
+            f"{{status{i}}} [{key}] {module:<10} - {description}\n"
+            for i, (module, key, description) in enumerate(MODULE_CONFIGS)
+        )
+        + "\n## Installation\n\n"
+        "Missing modules? Download to: {mdns_dir}\n"
+        "Make executable: chmod +x <module>\n\n"
+        "## Keyboard Shortcuts\n\n"
+        "From main screen:\n"
+        "- m: Show this menu\n"
+        "- Ctrl+S/B/T/O/G/L: Quick launch modules\n"
+    )
+    
     def compose(self) -> ComposeResult:
         yield Header()
         yield Container(
@@ -572,39 +1076,14 @@ class ModulesScreen(Screen):
         self.sub_title = "Modules"
         content = self.query_one("#modules-content", Static)
         
-        # Module configurations
-        module_configs = [
-            ("stampt", "s", "Timestamped notes with dashboard"),
-            ("blipt", "b", "Quick scratchpad with numbered entries"),
-            ("smallt", "t", "Simple task manager"),
-            ("templet", "o", "Lightweight template manager"),
-            ("gitnot", "g", "Lightweight version control"),
-            ("ql", "l", "Quick command launcher"),
-        ]
-        
-        # Build content
-        lines = ["# Available Modules\n",
-                "Press the key shown to launch a module.\n\n"]
-        
-        for module, key, description in module_configs:
-            exists, _ = ModuleManager.check_module(module)
-            status = "✓" if exists else "✗"
-            status_color = "green" if exists else "dim"
-            lines.append(f"[{status_color}]{status}[/] [{key}] {module:<10} - {description}\n")
-        
-        lines.extend([
-            "\n## Installation\n\n",
-            f"Missing modules? Download to: {Path(sys.argv[0]).resolve().parent}\n",
-            "Make executable: chmod +x <module>\n\n",
-            "## Keyboard Shortcuts\n\n",
-            "From main screen:\n",
-            "- m: Show this menu\n",
-            "- Ctrl+S/B/T/O/G/L: Quick launch modules\n"
-        ])
-        
-        content.update("".join(lines))
-    
-    def _launch_module(self, module_name: str):
+        installed = ModuleManager.installed_modules()
+        statuses = {
+            f"status{i}": "[green]✓[/]" if module in installed else "[dim]✗[/]"
+            for i, (module, _, _) in enumerate(MODULE_CONFIGS)
+        }
+        content.update(self._MENU_TEMPLATE.format(mdns_dir=MDNS_DIR, **statuses))
+    
+    def action_launch_module(self, module_name: str):
         """Launch a module and exit mdns"""
         exists, _ = ModuleManager.check_module(module_name)
         if exists:
@@ -613,13 +1092,6 @@ class ModulesScreen(Screen):
         else:
             self.notify(f"{module_name} not installed", severity="error")
     
-    def action_launch_stampt(self): self._launch_module("stampt")
-    def action_launch_blipt(self): self._launch_module("blipt")
-    def action_launch_smallt(self): self._launch_module("smallt")
-    def action_launch_templet(self): self._launch_module("templet")
-    def action_launch_gitnot(self): self._launch_module("gitnot")
-    def action_launch_ql(self): self._launch_module("ql")
-    
     def action_close(self):
         """Close modules screen"""
         self.app.pop_screen()
@@ -703,6 +1175,9 @@ class MDNSApp(App):
     
     TITLE = "mdns - markdown notes studio"
     
+    # Matches the notes created by action_new_untitled
+    _UNTITLED_RE = re.compile(r"untitled-(\d+)\.md")
+    
     CSS = """
     Screen {
         background: $surface;
@@ -770,17 +1245,26 @@ class MDNSApp(App):
         Binding("p", "preview", "Preview"),
         Binding("m", "show_modules", "Modules"),
         # Module shortcuts
-        Binding("ctrl+s", "launch_stampt", "Stampt", show=False),
-        Binding("ctrl+b", "launch_blipt", "Blipt", show=False),
-        Binding("ctrl+t", "launch_smallt", "Smallt", show=False),
-        Binding("ctrl+o", "launch_templet", "Templet", show=False),
-        Binding("ctrl+g", "launch_gitnot", "Gitnot", show=False),
-        Binding("ctrl+l", "launch_ql", "QL", show=False),
+        Binding("ctrl+s", "launch_module('stampt')", "Stampt", show=False),
+        Binding("ctrl+b", "launch_module('blipt')", "Blipt", show=False),
+        Binding("ctrl+t", "launch_module('smallt')", "Smallt", show=False),
+        Binding("ctrl+o", "launch_module('templet')", "Templet", show=False),
+        Binding("ctrl+g", "launch_module('gitnot')", "Gitnot", show=False),
+        Binding("ctrl+l", "launch_module('ql')", "QL", show=False),
     ]
     
     def __init__(self):
         super().__init__()
         self._module_to_launch = None
+        self._search_timer = None
+        # Text and time of the last coalesced notification
+        self._last_notify: Tuple[str, float] = ("", 0.0)
+        # Timestamp of the last new note and how many shared it
+        self._last_stamp = ""
+        self._stamp_seq = 0
+        # Set in on_mount once the widgets exist
+        self._file_list: Optional[FileExplorer] = None
+        self._search_input: Optional[Input] = None
     
     def compose(self) -> ComposeResult:
         yield Header()
@@ -796,67 +1280,108 @@ class MDNSApp(App):
         
     def on_mount(self):
         """Initialize the app"""
-        file_list = self.query_one("#file-list", FileExplorer)
+        # Look the widgets up once; actions use these references
+        self._file_list = self.query_one("#file-list", FileExplorer)
+        self._search_input = self.query_one("#search-input", Input)
+        file_list = self._file_list
         file_list.refresh_files()
         file_list.focus()
-        self.sub_title = str(Path.cwd())
+        self.sub_title = str(file_list.path)
         
     def on_input_changed(self, event: Input.Changed):
         """Handle search input changes"""
         if event.input.id == "search-input":
-            file_list = self.query_one("#file-list", FileExplorer)
-            file_list.refresh_files(event.value)
+            file_list = self._file_list
+            # Coalesce a burst of keystrokes into a single refresh
+            if self._search_timer is not None:
+                self._search_timer.stop()
+            value = event.value
+            self._search_timer = self.set_timer(
+                SEARCH_DEBOUNCE,
+                lambda: file_list.refresh_files(value, incremental=True)
+            )
         
     def action_new_note(self):
         """Create new timestamped note"""
         timestamp = datetime.now().strftime("%Y-%m-%d-%H%M%S")
-        self.push_screen(EditorScreen(Path(f"{timestamp}.md")))
+        # Number notes made within the same second so they don't collide
+        if timestamp == self._last_stamp:
+            self._stamp_seq += 1
+            name = f"{timestamp}-{self._stamp_seq}.md"
+        else:
+            self._last_stamp = timestamp
+            self._stamp_seq = 0
+            name = f"{timestamp}.md"
+        self.push_screen(EditorScreen(self._file_list.path / name))
         
     def action_new_untitled(self):
         """Create new untitled note"""
-        i = 1
-        while Path(f"untitled-{i}.md").exists():
-            i += 1
-        self.push_screen(EditorScreen(Path(f"untitled-{i}.md")))
+        directory = self._file_list.path
+        # One directory scan instead of probing untitled-1, -2, ... in turn
+        try:
+            with os.scandir(directory) as it:
+                numbers = [
+                    int(match.group(1)) for entry in it
+                    if (match := self._UNTITLED_RE.fullmatch(entry.name))
+                ]
+        except OSError:
+            numbers = []
+        i = max(numbers, default=0) + 1
+        self.push_screen(EditorScreen(directory / f"untitled-{i}.md"))
         
     def action_search(self):
         """Focus search input"""
-        self.query_one("#search-input", Input).focus()
+        self._search_input.focus()
         
     def action_clear_search(self):
         """Clear search or go to parent"""
-        search = self.query_one("#search-input", Input)
+        search = self._search_input
         if search.value:
             search.value = ""
-            self.query_one("#file-list", FileExplorer).focus()
+            self._file_list.focus()
         else:
             self.action_go_parent()
         
     def action_toggle_hidden(self):
         """Toggle hidden files"""
-        file_list = self.query_one("#file-list", FileExplorer)
+        file_list = self._file_list
         file_list.show_hidden = not file_list.show_hidden
-        file_list.refresh_files(file_list.current_filter)
-        self.notify(f"Hidden files: {'shown' if file_list.show_hidden else 'hidden'}")
+        # The directory hasn't changed, so just filter what was read
+        file_list.refilter()
+        self._notify_coalesced(f"Hidden files: {'shown' if file_list.show_hidden else 'hidden'}")
         
     def action_refresh(self):
         """Refresh file list"""
-        file_list = self.query_one("#file-list", FileExplorer)
+        ModuleManager.clear_cache()
+        file_list = self._file_list
         file_list.refresh_files(file_list.current_filter)
-        self.notify("Refreshed")
+        self._notify_coalesced("Refreshed")
+        
+    def _notify_coalesced(self, message: str):
+        """Notify, unless the same message was just sent
+        
+        Holding a key down repeats its action; this keeps that from
+        stacking up identical toasts. Dropped repeats extend the window.
+        """
+        now = time.monotonic()
+        last_message, last_time = self._last_notify
+        self._last_notify = (message, now)
+        if message == last_message and now - last_time < NOTIFY_REPEAT_WINDOW:
+            return
+        self.notify(message)
         
     def action_preview(self):
         """Preview selected file"""
-        file_list = self.query_one("#file-list", FileExplorer)
+        file_list = self._file_list
         if highlighted := file_list.highlighted_child:
-            if isinstance(highlighted, FileItem) and highlighted.path.is_file():
+            if isinstance(highlighted, FileItem) and highlighted.is_file:
                 self.push_screen(PreviewScreen(highlighted.path))
                 
     def action_delete_file(self):
         """Delete selected file with confirmation"""
-        file_list = self.query_one("#file-list", FileExplorer)
+        file_list = self._file_list
         if highlighted := file_list.highlighted_child:
-            if isinstance(highlighted, FileItem) and highlighted.path.is_file():
+            if isinstance(highlighted, FileItem) and highlighted.is_file:
                 def do_delete():
                     try:
                         highlighted.path.unlink()
@@ -879,18 +1404,27 @@ class MDNSApp(App):
     def action_go_parent(self):
         """Go to parent directory"""
         try:
-            os.chdir("..")
-            self.sub_title = str(Path.cwd())
-            file_list = self.query_one("#file-list", FileExplorer)
-            file_list.refresh_files()
-            self.query_one("#search-input", Input).value = ""
+            self._change_directory(self._file_list.path.parent)
         except Exception as e:
             self.notify(f"Cannot go to parent directory: {e}", severity="error")
+            
+    def _change_directory(self, path: Path):
+        """List another directory"""
+        # Stay put if the directory can't be listed, like chdir did
+        if not os.access(path, os.R_OK | os.X_OK):
+            if not path.is_dir():
+                raise FileNotFoundError(f"No such directory: '{path}'")
+            raise PermissionError(f"Permission denied: '{path}'")
+        self._file_list.path = path
+        self.sub_title = str(path)
+        self._file_list.refresh_files()
+        self._search_input.value = ""
+        
     def action_show_modules(self):
         """Show modules screen"""
         self.push_screen(ModulesScreen())
     
-    def _launch_module(self, module_name: str):
+    def action_launch_module(self, module_name: str):
         """Launch a module and exit mdns"""
         exists, _ = ModuleManager.check_module(module_name)
         if exists:
@@ -898,27 +1432,15 @@ class MDNSApp(App):
             self.exit()
         else:
             self.notify(f"{module_name} not installed", severity="error")
-    
-    # Module launch actions
-    def action_launch_stampt(self): self._launch_module("stampt")
-    def action_launch_blipt(self): self._launch_module("blipt")
-    def action_launch_smallt(self): self._launch_module("smallt")
-    def action_launch_templet(self): self._launch_module("templet")
-    def action_launch_gitnot(self): self._launch_module("gitnot")
-    def action_launch_ql(self): self._launch_module("ql")
         
     @on(ListView.Selected) 
     def on_list_view_selected(self, event: ListView.Selected):
         """Handle item selection"""
         if isinstance(event.item, FileItem):
             item = event.item
-            if item.path.is_dir():
+            if item.is_dir:
                 try:
-                    os.chdir(item.path)
-                    self.sub_title = str(Path.cwd())
-                    file_list = self.query_one("#file-list", FileExplorer)
-                    file_list.refresh_files()
-                    self.query_one("#search-input", Input).value = ""
+                    self._change_directory(item.path)
                 except Exception as e:
                     self.notify(f"Cannot enter: {e}", severity="error")
             else:
@@ -953,6 +1475,8 @@ def main():
             
             # Launch module after exit if requested
             if hasattr(app, '_module_to_launch') and app._module_to_launch:
+                # Start the module in the directory that was being browsed
+                os.chdir(app._file_list.path)
                 ModuleManager.run_module(app._module_to_launch)
                 
         except KeyboardInterrupt: